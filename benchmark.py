@@ -0,0 +1,56 @@
+"""
+Script de comparación de rendimiento para la librería de estadísticas.
+
+Compara las rutas especializadas en enteros con las rutas de punto flotante,
+usando los mismos valores convertidos a float, y el resumen robusto compartido
+con el cálculo por separado de cada medida robusta.
+"""
+
+import random
+import timeit
+
+from statistics_lib import (
+    media, mediana, moda, varianza, ds,
+    mad, media_recortada, media_winsorizada, resumen_robusto
+)
+
+
+def medir(funcion, numeros, repeticiones: int = 5) -> float:
+    """Retorna el mejor tiempo en segundos de varias ejecuciones."""
+    return min(timeit.repeat(lambda: funcion(numeros), number=1, repeat=repeticiones))
+
+
+def main():
+    """Compara los tiempos de las rutas enteras y flotantes"""
+
+    random.seed(42)
+    n = 200000
+    enteros = [random.randint(0, 1000) for _ in range(n)]
+    flotantes = [float(x) for x in enteros]
+
+    print(f"=== Comparación de Rendimiento (n = {n}) ===\n")
+    print(f"{'Función':<12}{'Enteros (s)':>14}{'Flotantes (s)':>16}{'Aceleración':>14}")
+
+    for nombre, funcion in [("media", media), ("mediana", mediana), ("moda", moda),
+                            ("varianza", varianza), ("ds", ds)]:
+        t_enteros = medir(funcion, enteros)
+        t_flotantes = medir(funcion, flotantes)
+        print(f"{nombre:<12}{t_enteros:>14.4f}{t_flotantes:>16.4f}"
+              f"{t_flotantes / t_enteros:>13.1f}x")
+
+    def por_separado(numeros):
+        mediana_val = mediana(numeros)
+        mediana([abs(x - mediana_val) for x in numeros])
+        media_recortada(numeros)
+        media_winsorizada(numeros)
+
+    ruidosos = [random.gauss(0, 1) for _ in range(n)]
+    print("\nMedidas robustas (flotantes):")
+    print(f"  mediana sola:        {medir(mediana, ruidosos):.4f} s")
+    print(f"  resumen_robusto:     {medir(resumen_robusto, ruidosos):.4f} s")
+    print(f"  llamadas separadas:  {medir(por_separado, ruidosos):.4f} s")
+    print(f"  mad:                 {medir(mad, ruidosos):.4f} s")
+
+
+if __name__ == "__main__":
+    main()
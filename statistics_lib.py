@@ -9,21 +9,31 @@ Una librería completa y eficiente para cálculos estadísticos básicos que inc
 - ds (desviación estándar)
 """
 
+import bisect
 import math
+import operator
+import os
+import threading
+import time
 from collections import Counter
-from typing import List, Union, Optional
+from typing import Callable, Dict, List, Union, Optional
 import sys
 
+# Los módulos pesados (sqlite3, json, hashlib, concurrent.futures y los backends
+# acelerados) se importan dentro de las funciones que los usan para que importar
+# la librería sea casi instantáneo.
+
 
 class ErrorEstadisticas(Exception):
     """Excepción personalizada para errores relacionados con estadísticas"""
     pass
 
 
-_calculo_cache = {}
+_UMBRAL_PARALELO = 10000
+_TAMANO_MINIMO_FRAGMENTO = 5000
 
 
-def _validar_entrada(numeros: List[Union[int, float]], funcion: str = "estadísticas") -> None:
+def _validar_entrada(numeros: List[Union[int, float]], funcion: str = "estadísticas") -> bool:
     """
     Valida la entrada de manera eficiente.
     
@@ -31,59 +41,300 @@ def _validar_entrada(numeros: List[Union[int, float]], funcion: str = "estadíst
         numeros: Lista de números a validar
         funcion: Nombre de la función para el mensaje de error
         
+    Returns:
+        bool: True si todos los valores son enteros, lo que habilita las rutas
+              exactas en aritmética entera
+        
     Raises:
         ErrorEstadisticas: Si la lista está vacía o contiene valores no numéricos
     """
     if not numeros:
         raise ErrorEstadisticas(f"No se puede calcular la {funcion} de una lista vacía")
     
-    for i, n in enumerate(numeros):
-        if not isinstance(n, (int, float)):
-            raise ErrorEstadisticas("Todos los valores deben ser numéricos")
+    # Una sola pasada en C sobre los tipos: la validación es la parte secuencial
+    # de todas las funciones, así que no debe limitar al modo por hilos
+    tipos = set(map(type, numeros))
+    if not all(issubclass(t, (int, float)) for t in tipos):
+        raise ErrorEstadisticas("Todos los valores deben ser numéricos")
+    return not any(issubclass(t, float) for t in tipos)
 
 
-def _obtener_media_cached(numeros: List[Union[int, float]]) -> float:
+def _validar_hilos(hilos: Optional[int]) -> None:
     """
-    Obtiene la media con cache para evitar recálculos.
+    Valida el número de hilos del modo por fragmentos.
+    
+    Raises:
+        ErrorEstadisticas: Si hilos no es None ni un entero positivo
+    """
+    if hilos is not None and (isinstance(hilos, bool) or not isinstance(hilos, int) or hilos < 1):
+        raise ErrorEstadisticas("El número de hilos debe ser positivo")
+
+
+_FUNCIONES_ACELERABLES = ('media', 'mediana', 'moda', 'varianza', 'ds')
+
+_backends = {}
+_backend_lock = threading.Lock()
+# (nombre seleccionado, forzar); se reemplaza en una sola asignación para que
+# ningún hilo vea un nombre nuevo con el valor de forzar anterior
+_backend_estado = (None, False)
+
+
+def registrar_backend(nombre: str, cargador: Callable[[], Dict[str, Callable]],
+                      requiere: Optional[str] = None, umbral: int = 100000) -> None:
+    """
+    Registra un backend acelerado que se carga de forma diferida.
+    
+    El cargador no se ejecuta al registrar; se llama la primera vez que una
+    función recibe una lista de al menos ``umbral`` elementos (o al forzar el
+    backend) y debe retornar un diccionario con algunas de las claves media,
+    mediana, moda, varianza y ds. Un kernel puede retornar None para indicar que
+    no admite esos datos, en cuyo caso se usa la implementación en Python puro.
     
     Args:
-        numeros: Lista de números
-        
+        nombre: Nombre del backend
+        cargador: Función sin argumentos que importa las dependencias y retorna los kernels
+        requiere: Módulo del que depende el backend, usado para comprobar si está
+                  disponible sin importarlo
+        umbral: Tamaño mínimo de la lista a partir del cual se usa el backend
+    """
+    if nombre == 'python':
+        raise ErrorEstadisticas("El backend 'python' está reservado")
+    
+    with _backend_lock:
+        _backends[nombre] = {
+            'cargador': cargador,
+            'requiere': requiere,
+            'umbral': umbral,
+            'kernels': None,
+            'error': None,
+            # Garantiza una sola carga sin retener _backend_lock mientras corre
+            # el cargador; es reentrante para detectar llamadas desde el propio cargador
+            'carga_lock': threading.RLock(),
+            'cargando': False
+        }
+
+
+def listar_backends() -> List[dict]:
+    """
+    Lista los backends conocidos sin cargar ninguno.
+    
     Returns:
-        float: La media aritmética
+        list: Un diccionario por backend con 'nombre', 'disponible', 'cargado',
+              'umbral' y 'seleccionado'
+    """
+    with _backend_lock:
+        seleccionado = _backend_estado[0]
+        resultado = [{
+            'nombre': 'python',
+            'disponible': True,
+            'cargado': True,
+            'umbral': 0,
+            'seleccionado': seleccionado == 'python'
+        }]
+        for nombre, backend in _backends.items():
+            resultado.append({
+                'nombre': nombre,
+                'disponible': _backend_disponible(nombre),
+                'cargado': backend['kernels'] is not None,
+                'umbral': backend['umbral'],
+                'seleccionado': seleccionado == nombre
+            })
+    return resultado
+
+
+def seleccionar_backend(nombre: Optional[str] = None, forzar: bool = False) -> None:
+    """
+    Selecciona el backend usado por media, mediana, moda, varianza y ds.
+    
+    Args:
+        nombre: None para selección automática (el primer backend disponible para
+                listas grandes), 'python' para usar solo la implementación en Python
+                puro, o el nombre de un backend registrado.
+        forzar: Si True, el backend se usa con listas de cualquier tamaño.
+        
+    Raises:
+        ErrorEstadisticas: Si el backend no está registrado o no se puede cargar
     """
-    cache_key = tuple(numeros)
+    global _backend_estado
     
-    if cache_key in _calculo_cache:
-        return _calculo_cache[cache_key]['media']
+    if nombre is not None and nombre != 'python':
+        if nombre not in _backends:
+            raise ErrorEstadisticas(f"Backend desconocido: {nombre}")
+        if forzar:
+            if _cargar_backend(nombre) is None:
+                raise ErrorEstadisticas(f"No se pudo cargar el backend {nombre}: "
+                                        f"{_backends[nombre]['error']}")
+        elif not _backend_disponible(nombre):
+            backend = _backends[nombre]
+            causa = (backend['error'] if backend['error'] is not None
+                     else f"falta el módulo {backend['requiere']}")
+            raise ErrorEstadisticas(f"No se pudo cargar el backend {nombre}: {causa}")
     
-    suma = sum(numeros)
-    longitud = len(numeros)
-    media_val = suma / longitud
+    with _backend_lock:
+        _backend_estado = (nombre, forzar)
+
+
+def _backend_disponible(nombre: str) -> bool:
+    """Comprueba si un backend puede cargarse sin llegar a importarlo."""
+    import importlib.util
     
-    _calculo_cache[cache_key] = {
-        'media': media_val,
-        'suma': suma,
-        'longitud': longitud
-    }
+    backend = _backends[nombre]
+    if backend['error'] is not None:
+        return False
+    if backend['kernels'] is not None or backend['requiere'] is None:
+        return True
+    return importlib.util.find_spec(backend['requiere']) is not None
+
+
+def _cargar_backend(nombre: str) -> Optional[Dict[str, Callable]]:
+    """
+    Carga un backend la primera vez que se necesita; retorna None si no está disponible.
+    
+    El cargador se ejecuta fuera de _backend_lock, así que puede usar el registro
+    (listar_backends, registrar_backend...) y una importación lenta no bloquea a
+    los demás hilos. El bloqueo propio del backend hace que solo un hilo lo cargue;
+    si el cargador vuelve a pedir su propio backend, este se trata como no disponible.
+    """
+    with _backend_lock:
+        backend = _backends.get(nombre)
+        if backend is None:
+            return None
+        if backend['kernels'] is not None or backend['error'] is not None:
+            return backend['kernels']
     
-    return media_val
+    with backend['carga_lock']:
+        with _backend_lock:
+            if backend['kernels'] is not None or backend['cargando']:
+                return backend['kernels']
+            if backend['error'] is not None:
+                return None
+            backend['cargando'] = True
+        
+        kernels, error = None, None
+        try:
+            kernels = backend['cargador']()
+        except ImportError as e:
+            error = e
+        finally:
+            with _backend_lock:
+                backend['kernels'] = kernels
+                backend['error'] = error
+                backend['cargando'] = False
+        return kernels
 
 
-def media(numeros: List[Union[int, float]]) -> float:
+def _kernel_acelerado(funcion: str, n: int, enteros: bool) -> Optional[Callable]:
+    """
+    Retorna el kernel acelerado que corresponde a la función y al tamaño, si lo hay.
+    
+    En modo automático las listas de solo enteros se quedan en las rutas exactas
+    en Python; un backend seleccionado explícitamente las recibe igualmente.
+    """
+    seleccionado, forzado = _backend_estado
+    if seleccionado == 'python' or (seleccionado is None and enteros):
+        return None
+    
+    with _backend_lock:
+        if seleccionado is None:
+            candidatos = list(_backends.items())
+        elif seleccionado in _backends:
+            candidatos = [(seleccionado, _backends[seleccionado])]
+        else:
+            candidatos = []
+    
+    for nombre, backend in candidatos:
+        if not forzado and n < backend['umbral']:
+            continue
+        kernels = _cargar_backend(nombre)
+        if kernels is None:
+            # Sin error registrado, el backend se está cargando en este mismo hilo
+            if seleccionado is not None and backend['error'] is not None:
+                raise ErrorEstadisticas(f"No se pudo cargar el backend {nombre}: "
+                                        f"{backend['error']}")
+            continue
+        if funcion in kernels:
+            return kernels[funcion]
+    return None
+
+
+def _cargar_numpy() -> Dict[str, Callable]:
+    """Kernels basados en NumPy; solo se importa NumPy al llamar a esta función."""
+    import numpy as np
+    
+    def _arreglo(numeros):
+        arreglo = np.asarray(numeros)
+        if arreglo.dtype.kind != 'f':
+            # Los enteros se dejan a las rutas exactas en Python: en float64 (o en
+            # int64 al elevar al cuadrado) perderían precisión
+            return None
+        return arreglo
+    
+    def _media(numeros):
+        arreglo = _arreglo(numeros)
+        return None if arreglo is None else float(np.mean(arreglo))
+    
+    def _mediana(numeros):
+        arreglo = _arreglo(numeros)
+        return None if arreglo is None else float(np.median(arreglo))
+    
+    def _moda(numeros):
+        arreglo = _arreglo(numeros)
+        # Con listas pequeñas el desempate es por orden de aparición
+        if arreglo is None or len(numeros) <= 100:
+            return None
+        valores, frecuencias = np.unique(arreglo, return_counts=True)
+        return valores[np.argmax(frecuencias)].item()
+    
+    def _varianza(numeros, poblacion):
+        arreglo = _arreglo(numeros)
+        return None if arreglo is None else float(np.var(arreglo, ddof=0 if poblacion else 1))
+    
+    def _ds(numeros, poblacion):
+        arreglo = _arreglo(numeros)
+        return None if arreglo is None else float(np.std(arreglo, ddof=0 if poblacion else 1))
+    
+    return {
+        'media': _media,
+        'mediana': _mediana,
+        'moda': _moda,
+        'varianza': _varianza,
+        'ds': _ds
+    }
+
+
+registrar_backend('numpy', _cargar_numpy, requiere='numpy')
+
+
+def media(numeros: List[Union[int, float]], hilos: Optional[int] = None) -> float:
     """
     Calcula la media aritmética de una lista de números de manera optimizada.
     
     Args:
         numeros: Lista de números (int o float)
+        hilos: Si se indica, las listas grandes se procesan por fragmentos en
+               un grupo de hilos de ese tamaño (ver _en_paralelo).
         
     Returns:
         float: La media aritmética
         
     Raises:
-        ErrorEstadisticas: Si la lista está vacía o contiene valores no numéricos
+        ErrorEstadisticas: Si la lista está vacía, contiene valores no numéricos
+                        o hilos no es un entero positivo
     """
-    _validar_entrada(numeros, "media")
+    enteros = _validar_entrada(numeros, "media")
+    _validar_hilos(hilos)
+    
+    kernel = _kernel_acelerado('media', len(numeros), enteros)
+    if kernel is not None:
+        resultado = kernel(numeros)
+        if resultado is not None:
+            return resultado
+    
+    if hilos is not None and len(numeros) > _UMBRAL_PARALELO:
+        return _media_paralela(numeros, hilos)
+    
+    if enteros:
+        return sum(numeros) / len(numeros)
     
     if len(numeros) > 1000:
         suma = 0.0
@@ -107,48 +358,230 @@ def mediana(numeros: List[Union[int, float]]) -> float:
     Raises:
         ErrorEstadisticas: Si la lista está vacía o contiene valores no numéricos
     """
-    _validar_entrada(numeros, "mediana")
+    enteros = _validar_entrada(numeros, "mediana")
     
     n = len(numeros)
     
+    kernel = _kernel_acelerado('mediana', n, enteros)
+    if kernel is not None:
+        resultado = kernel(numeros)
+        if resultado is not None:
+            return resultado
+    
     if n <= 50:
         numeros_ordenados = sorted(numeros)
         if n % 2 == 0:
             return (numeros_ordenados[n // 2 - 1] + numeros_ordenados[n // 2]) / 2
         else:
             return numeros_ordenados[n // 2]
-    else:
-        return _mediana_rapida(numeros.copy(), n // 2)
+    
+    if enteros:
+        minimo, maximo = min(numeros), max(numeros)
+        if maximo - minimo <= n:
+            return _mediana_conteo(numeros)
+    
+    return _MotorSeleccion(numeros).mediana()
+
+
+def _mediana_conteo(numeros: List[int]) -> float:
+    """
+    Mediana por conteo para enteros con un rango de valores pequeño.
+    
+    Solo se ordenan los valores distintos, nunca la lista completa.
+    """
+    n = len(numeros)
+    contador = Counter(numeros)
+    objetivos = (n // 2 - 1, n // 2) if n % 2 == 0 else (n // 2,)
+    
+    encontrados = []
+    acumulado = 0
+    for valor in sorted(contador):
+        acumulado += contador[valor]
+        while len(encontrados) < len(objetivos) and objetivos[len(encontrados)] < acumulado:
+            encontrados.append(valor)
+        if len(encontrados) == len(objetivos):
+            break
+    
+    if n % 2 == 0:
+        return (encontrados[0] + encontrados[1]) / 2
+    return encontrados[0]
 
 
-def _mediana_rapida(numeros: List[Union[int, float]], k: int) -> float:
+def _seleccionar(datos: List[Union[int, float]], k: int, izq: int, der: int) -> Union[int, float]:
     """
-    Algoritmo de selección rápida para encontrar el k-ésimo elemento.
-    Optimizado para listas grandes.
+    Selección rápida iterativa e in situ del k-ésimo elemento dentro de [izq, der].
+    
+    Al terminar, datos[k] ocupa su posición ordenada, los valores de [izq, k) son
+    menores o iguales y los de (k, der] mayores o iguales. La partición en tres
+    vías evita el caso cuadrático con muchos valores repetidos; si aun así las
+    particiones no reducen el tramo lo suficiente (por ejemplo con datos en forma
+    de V), el tramo restante se ordena con sorted() y el peor caso es O(n log n).
     """
-    if len(numeros) == 1:
-        return numeros[0]
+    particiones_restantes = 2 * (der - izq + 1).bit_length()
+    while izq < der:
+        if particiones_restantes == 0:
+            datos[izq:der + 1] = sorted(datos[izq:der + 1])
+            return datos[k]
+        particiones_restantes -= 1
+        
+        pivote = datos[_pivote_tukey(datos, izq, der)]
+        
+        menores, i, mayores = izq, izq, der
+        while i <= mayores:
+            valor = datos[i]
+            if valor < pivote:
+                datos[menores], datos[i] = valor, datos[menores]
+                menores += 1
+                i += 1
+            elif valor > pivote:
+                datos[mayores], datos[i] = valor, datos[mayores]
+                mayores -= 1
+            else:
+                i += 1
+        
+        if k < menores:
+            der = menores - 1
+        elif k > mayores:
+            izq = mayores + 1
+        else:
+            return pivote
     
-    primero, medio, ultimo = 0, len(numeros) // 2, len(numeros) - 1
-    pivote_idx = _seleccionar_pivote(numeros, primero, medio, ultimo)
+    return datos[k]
+
+
+class _MotorSeleccion:
+    """
+    Copia de trabajo de los datos sobre la que se encadenan varias selecciones.
     
-    numeros[0], numeros[pivote_idx] = numeros[pivote_idx], numeros[0]
-    pivote = numeros[0]
+    Cada índice seleccionado queda fijo en su posición ordenada y divide la copia
+    en tramos independientes, así que las selecciones posteriores solo recorren
+    el tramo que contiene al nuevo índice.
+    """
     
-    i = 1
-    for j in range(1, len(numeros)):
-        if numeros[j] < pivote:
-            numeros[i], numeros[j] = numeros[j], numeros[i]
-            i += 1
+    def __init__(self, numeros: List[Union[int, float]]):
+        self.datos = list(numeros)
+        self.n = len(self.datos)
+        self._fijos = []
+        self._ordenado = False
     
-    numeros[0], numeros[i-1] = numeros[i-1], numeros[0]
+    def k_esimo(self, k: int) -> Union[int, float]:
+        """Retorna el k-ésimo menor valor (base 0) y lo fija en su posición."""
+        if self._ordenado:
+            return self.datos[k]
+        
+        i = bisect.bisect_left(self._fijos, k)
+        if i < len(self._fijos) and self._fijos[i] == k:
+            return self.datos[k]
+        
+        izq = self._fijos[i - 1] + 1 if i > 0 else 0
+        der = self._fijos[i] - 1 if i < len(self._fijos) else self.n - 1
+        valor = _seleccionar(self.datos, k, izq, der)
+        self._fijos.insert(i, k)
+        return valor
     
-    if i-1 == k:
-        return pivote
-    elif i-1 > k:
-        return _mediana_rapida(numeros[:i-1], k)
-    else:
-        return _mediana_rapida(numeros[i:], k - i)
+    def mediana(self) -> float:
+        """Mediana de los datos actuales."""
+        superior = self.k_esimo(self.n // 2)
+        if self.n % 2 == 0:
+            return (self._fijar_anterior(self.n // 2) + superior) / 2
+        return superior
+    
+    def _fijar_anterior(self, k: int) -> Union[int, float]:
+        """
+        Fija el índice k-1 cuando k ya está fijo: el tramo a su izquierda solo
+        tiene valores menores o iguales, así que basta con llevar su máximo a k-1
+        (max e index recorren el tramo en C, sin otra selección).
+        """
+        if self._ordenado:
+            return self.datos[k - 1]
+        
+        i = bisect.bisect_left(self._fijos, k - 1)
+        if i < len(self._fijos) and self._fijos[i] == k - 1:
+            return self.datos[k - 1]
+        
+        datos = self.datos
+        izq = self._fijos[i - 1] + 1 if i > 0 else 0
+        valor = max(datos[izq:k])
+        j = datos.index(valor, izq, k)
+        datos[j], datos[k - 1] = datos[k - 1], datos[j]
+        self._fijos.insert(i, k - 1)
+        return valor
+    
+    def extremos_recortados(self, g: int) -> tuple:
+        """
+        Fija los índices g y n-g-1; entre ambos quedan los valores centrales.
+        
+        Returns:
+            tuple: (valor en g, valor en n-g-1)
+        """
+        return self.k_esimo(g), self.k_esimo(self.n - g - 1)
+    
+    def ordenar(self) -> None:
+        """
+        Ordena in situ cada tramo entre índices fijos; como los tramos ya están
+        separados entre sí, el resultado es la copia completa ordenada.
+        """
+        if self._ordenado:
+            return
+        
+        limites = [-1] + self._fijos + [self.n]
+        datos = self.datos
+        for inicio, fin in zip(limites, limites[1:]):
+            if fin - inicio > 2:
+                datos[inicio + 1:fin] = sorted(datos[inicio + 1:fin])
+        self._ordenado = True
+    
+    def mad(self, centro: float) -> float:
+        """
+        MAD respecto a centro, que debe ser la mediana, sin crear la lista de
+        desviaciones ni hacer una nueva selección.
+        
+        Con la copia ordenada, las desviaciones de la mitad inferior (centro - x,
+        recorrida de derecha a izquierda) y las de la mitad superior (x - centro)
+        son dos secuencias ascendentes; la mediana de su unión se obtiene con una
+        búsqueda binaria.
+        """
+        self.ordenar()
+        datos, n = self.datos, self.n
+        mitad = n // 2
+        
+        def inferior(i):
+            return centro - datos[mitad - 1 - i]
+        
+        def superior(j):
+            return datos[mitad + j] - centro
+        
+        valor_superior = _k_esimo_de_dos(inferior, mitad, superior, n - mitad, n // 2)
+        if n % 2 == 0:
+            valor_inferior = _k_esimo_de_dos(inferior, mitad, superior, n - mitad, n // 2 - 1)
+            return (valor_inferior + valor_superior) / 2
+        return valor_superior
+
+
+def _k_esimo_de_dos(a: Callable[[int], float], largo_a: int,
+                    b: Callable[[int], float], largo_b: int, k: int) -> float:
+    """
+    k-ésimo menor valor (base 0) de la unión de dos secuencias ascendentes dadas
+    por funciones de acceso, en O(log n).
+    """
+    # Se busca cuántos elementos i tomar de a (y k + 1 - i de b)
+    bajo, alto = max(0, k + 1 - largo_b), min(k + 1, largo_a)
+    while bajo < alto:
+        i = (bajo + alto) // 2
+        j = k + 1 - i
+        if j > 0 and a(i) < b(j - 1):
+            bajo = i + 1
+        else:
+            alto = i
+    
+    i = bajo
+    j = k + 1 - i
+    candidatos = []
+    if i > 0:
+        candidatos.append(a(i - 1))
+    if j > 0:
+        candidatos.append(b(j - 1))
+    return max(candidatos)
 
 
 def _seleccionar_pivote(numeros: List[Union[int, float]], i: int, j: int, k: int) -> int:
@@ -162,6 +595,24 @@ def _seleccionar_pivote(numeros: List[Union[int, float]], i: int, j: int, k: int
         return k
 
 
+def _pivote_tukey(numeros: List[Union[int, float]], izq: int, der: int) -> int:
+    """
+    Pivote por la mediana de nueve (ninther de Tukey) en tramos grandes y por la
+    mediana de tres en tramos pequeños.
+    """
+    medio = (izq + der) // 2
+    if der - izq < 40:
+        return _seleccionar_pivote(numeros, izq, medio, der)
+    
+    paso = (der - izq) // 8
+    return _seleccionar_pivote(
+        numeros,
+        _seleccionar_pivote(numeros, izq, izq + paso, izq + 2 * paso),
+        _seleccionar_pivote(numeros, medio - paso, medio, medio + paso),
+        _seleccionar_pivote(numeros, der - 2 * paso, der - paso, der)
+    )
+
+
 def moda(numeros: List[Union[int, float]]) -> Union[int, float]:
     """
     Calcula la moda de una lista de números de manera optimizada.
@@ -176,10 +627,16 @@ def moda(numeros: List[Union[int, float]]) -> Union[int, float]:
     Raises:
         ErrorEstadisticas: Si la lista está vacía o contiene valores no numéricos
     """
-    _validar_entrada(numeros, "moda")
+    enteros = _validar_entrada(numeros, "moda")
     
     n = len(numeros)
     
+    kernel = _kernel_acelerado('moda', n, enteros)
+    if kernel is not None:
+        resultado = kernel(numeros)
+        if resultado is not None:
+            return resultado
+    
     if n <= 100:
         contador = Counter(numeros)
         frecuencia_maxima = max(contador.values())
@@ -187,10 +644,24 @@ def moda(numeros: List[Union[int, float]]) -> Union[int, float]:
         for valor in numeros:
             if contador[valor] == frecuencia_maxima:
                 return valor
+    elif enteros:
+        return _moda_conteo(numeros)
     else:
         return _moda_optimizada(numeros)
 
 
+def _moda_conteo(numeros: List[int]) -> int:
+    """
+    Moda por conteo para listas grandes de enteros, sin ordenar la lista.
+    
+    Con empates retorna el menor valor, igual que _moda_optimizada.
+    """
+    contador = Counter(numeros)
+    frecuencia_maxima = max(contador.values())
+    return min(valor for valor, frecuencia in contador.items()
+               if frecuencia == frecuencia_maxima)
+
+
 def _moda_optimizada(numeros: List[Union[int, float]]) -> Union[int, float]:
     """
     Algoritmo optimizado para encontrar la moda en listas grandes.
@@ -218,7 +689,8 @@ def _moda_optimizada(numeros: List[Union[int, float]]) -> Union[int, float]:
     return valor_moda
 
 
-def varianza(numeros: List[Union[int, float]], poblacion: bool = True) -> float:
+def varianza(numeros: List[Union[int, float]], poblacion: bool = True,
+             hilos: Optional[int] = None) -> float:
     """
     Calcula la varianza de una lista de números de manera optimizada.
     
@@ -226,21 +698,35 @@ def varianza(numeros: List[Union[int, float]], poblacion: bool = True) -> float:
         numeros: Lista de números (int o float)
         poblacion: Si True, calcula varianza poblacional (divide por n).
                    Si False, calcula varianza muestral (divide por n-1).
+        hilos: Si se indica, las listas grandes se procesan por fragmentos en
+               un grupo de hilos de ese tamaño.
         
     Returns:
         float: La varianza
         
     Raises:
         ErrorEstadisticas: Si la lista está vacía, tiene solo un elemento (para muestra),
-                        o contiene valores no numéricos
+                        contiene valores no numéricos o hilos no es un entero positivo
     """
-    _validar_entrada(numeros, "varianza")
+    enteros = _validar_entrada(numeros, "varianza")
+    _validar_hilos(hilos)
     
     n = len(numeros)
     if not poblacion and n < 2:
         raise ErrorEstadisticas("La varianza muestral requiere al menos 2 valores")
     
-    if n <= 1000:
+    kernel = _kernel_acelerado('varianza', n, enteros)
+    if kernel is not None:
+        resultado = kernel(numeros, poblacion)
+        if resultado is not None:
+            return resultado
+    
+    if enteros:
+        return _varianza_enteros(numeros, poblacion, hilos)
+    
+    if hilos is not None and n > _UMBRAL_PARALELO:
+        suma_cuadrados = _resumen_paralelo(numeros, hilos)['m2']
+    elif n <= 1000:
         media_val = media(numeros)
         suma_cuadrados = sum((x - media_val) ** 2 for x in numeros)
     else:
@@ -252,6 +738,34 @@ def varianza(numeros: List[Union[int, float]], poblacion: bool = True) -> float:
         return suma_cuadrados / (n - 1)
 
 
+def _varianza_enteros(numeros: List[int], poblacion: bool,
+                      hilos: Optional[int] = None) -> float:
+    """
+    Varianza exacta para enteros usando suma y suma de cuadrados enteras.
+    
+    n·Σx² − (Σx)² se calcula sin redondeo y solo la división final produce un float.
+    Con hilos, cada fragmento aporta sus sumas enteras, que se suman sin pérdida.
+    """
+    n = len(numeros)
+    if hilos is not None and n > _UMBRAL_PARALELO:
+        sumas = _en_paralelo(numeros, hilos, _sumas_enteras)
+        suma = sum(s for s, _ in sumas)
+        suma_cuadrados = sum(c for _, c in sumas)
+    else:
+        suma, suma_cuadrados = _sumas_enteras(numeros)
+    numerador = n * suma_cuadrados - suma * suma
+    
+    if poblacion:
+        return numerador / (n * n)
+    else:
+        return numerador / (n * (n - 1))
+
+
+def _sumas_enteras(numeros: List[int]) -> tuple:
+    """Suma y suma de cuadrados exactas de un fragmento de enteros."""
+    return sum(numeros), sum(map(operator.mul, numeros, numeros))
+
+
 def _varianza_welford(numeros: List[Union[int, float]]) -> tuple[float, float]:
     """
     Algoritmo de Welford para calcular varianza de manera numéricamente estable.
@@ -271,7 +785,8 @@ def _varianza_welford(numeros: List[Union[int, float]]) -> tuple[float, float]:
     return suma_cuadrados, media
 
 
-def ds(numeros: List[Union[int, float]], poblacion: bool = True) -> float:
+def ds(numeros: List[Union[int, float]], poblacion: bool = True,
+       hilos: Optional[int] = None) -> float:
     """
     Calcula la desviación estándar de una lista de números de manera optimizada.
     
@@ -279,51 +794,207 @@ def ds(numeros: List[Union[int, float]], poblacion: bool = True) -> float:
         numeros: Lista de números (int o float)
         poblacion: Si True, calcula desviación estándar poblacional.
                    Si False, calcula desviación estándar muestral.
+        hilos: Si se indica, las listas grandes se procesan por fragmentos en
+               un grupo de hilos de ese tamaño.
         
     Returns:
         float: La desviación estándar
         
     Raises:
         ErrorEstadisticas: Si la lista está vacía, tiene solo un elemento (para muestra),
-                        o contiene valores no numéricos
+                        contiene valores no numéricos o hilos no es un entero positivo
     """
-    _validar_entrada(numeros, "desviación estándar")
+    enteros = _validar_entrada(numeros, "desviación estándar")
+    _validar_hilos(hilos)
     
     n = len(numeros)
     if not poblacion and n < 2:
         raise ErrorEstadisticas("La desviación estándar muestral requiere al menos 2 valores")
     
+    kernel = _kernel_acelerado('ds', n, enteros)
+    if kernel is not None:
+        resultado = kernel(numeros, poblacion)
+        if resultado is not None:
+            return resultado
+    
+    if enteros:
+        return math.sqrt(_varianza_enteros(numeros, poblacion, hilos))
+    
     if n <= 1000:
         var = varianza(numeros, poblacion)
         return math.sqrt(var)
     else:
-        suma_cuadrados, _ = _varianza_welford(numeros)
+        if hilos is not None and n > _UMBRAL_PARALELO:
+            suma_cuadrados = _resumen_paralelo(numeros, hilos)['m2']
+        else:
+            suma_cuadrados, _ = _varianza_welford(numeros)
         if poblacion:
             return math.sqrt(suma_cuadrados / n)
         else:
             return math.sqrt(suma_cuadrados / (n - 1))
 
 
+_FACTOR_MAD_NORMAL = 1.482602218505602
+
+
+def _validar_proporcion(proporcion: float) -> None:
+    """Valida la proporción de recorte por cada extremo."""
+    if not 0 <= proporcion < 0.5:
+        raise ErrorEstadisticas("La proporción de recorte debe estar entre 0 y 0.5")
+
+
+def _media_central(motor: _MotorSeleccion, g: int) -> float:
+    """Media de los valores entre los índices fijos g y n-g-1."""
+    return sum(motor.datos[g:motor.n - g]) / (motor.n - 2 * g)
+
+
+def _media_winsorizada_motor(motor: _MotorSeleccion, g: int) -> float:
+    """Media con los g valores de cada extremo sustituidos por el valor frontera."""
+    inferior, superior = motor.extremos_recortados(g)
+    suma = sum(motor.datos[g:motor.n - g]) + g * (inferior + superior)
+    return suma / motor.n
+
+
+def mad(numeros: List[Union[int, float]], normalizada: bool = False) -> float:
+    """
+    Calcula la desviación absoluta mediana (MAD) de una lista de números.
+    
+    Args:
+        numeros: Lista de números (int o float)
+        normalizada: Si True, escala el resultado por 1.4826 para que sea un
+                     estimador consistente de la desviación estándar en datos normales.
+        
+    Returns:
+        float: La mediana de las desviaciones absolutas respecto a la mediana
+        
+    Raises:
+        ErrorEstadisticas: Si la lista está vacía o contiene valores no numéricos
+    """
+    _validar_entrada(numeros, "MAD")
+    
+    motor = _MotorSeleccion(numeros)
+    resultado = motor.mad(motor.mediana())
+    
+    if normalizada:
+        return resultado * _FACTOR_MAD_NORMAL
+    return resultado
+
+
+def media_recortada(numeros: List[Union[int, float]], proporcion: float = 0.1) -> float:
+    """
+    Calcula la media recortada descartando una proporción de valores en cada extremo.
+    
+    Args:
+        numeros: Lista de números (int o float)
+        proporcion: Fracción de valores descartada en cada extremo, en [0, 0.5)
+        
+    Returns:
+        float: La media de los valores centrales
+        
+    Raises:
+        ErrorEstadisticas: Si la lista está vacía, contiene valores no numéricos
+                        o la proporción está fuera de rango
+    """
+    _validar_entrada(numeros, "media recortada")
+    _validar_proporcion(proporcion)
+    
+    motor = _MotorSeleccion(numeros)
+    g = int(proporcion * motor.n)
+    motor.extremos_recortados(g)
+    return _media_central(motor, g)
+
+
+def media_winsorizada(numeros: List[Union[int, float]], proporcion: float = 0.1) -> float:
+    """
+    Calcula la media winsorizada, sustituyendo los valores extremos por los
+    valores frontera en lugar de descartarlos.
+    
+    Args:
+        numeros: Lista de números (int o float)
+        proporcion: Fracción de valores sustituida en cada extremo, en [0, 0.5)
+        
+    Returns:
+        float: La media winsorizada
+        
+    Raises:
+        ErrorEstadisticas: Si la lista está vacía, contiene valores no numéricos
+                        o la proporción está fuera de rango
+    """
+    _validar_entrada(numeros, "media winsorizada")
+    _validar_proporcion(proporcion)
+    
+    motor = _MotorSeleccion(numeros)
+    return _media_winsorizada_motor(motor, int(proporcion * motor.n))
+
+
+def resumen_robusto(numeros: List[Union[int, float]], proporcion: float = 0.1) -> dict:
+    """
+    Calcula todas las medidas robustas compartiendo una sola copia de trabajo.
+    
+    La mediana parte la copia en dos mitades que luego se ordenan por separado;
+    con eso los recortes son cortes directos de la copia y la MAD se obtiene de
+    las dos mitades sin crear la lista de desviaciones.
+    
+    Args:
+        numeros: Lista de números (int o float)
+        proporcion: Fracción de recorte por extremo para las medias robustas
+        
+    Returns:
+        dict: Diccionario con 'mediana', 'mad', 'media_recortada' y 'media_winsorizada'
+        
+    Raises:
+        ErrorEstadisticas: Si la lista está vacía, contiene valores no numéricos
+                        o la proporción está fuera de rango
+    """
+    _validar_entrada(numeros, "estadística robusta")
+    _validar_proporcion(proporcion)
+    
+    motor = _MotorSeleccion(numeros)
+    g = int(proporcion * motor.n)
+    
+    mediana_val = motor.mediana()
+    mad_val = motor.mad(mediana_val)
+    media_winsorizada_val = _media_winsorizada_motor(motor, g)
+    media_recortada_val = _media_central(motor, g)
+    
+    return {
+        'mediana': mediana_val,
+        'mad': mad_val,
+        'media_recortada': media_recortada_val,
+        'media_winsorizada': media_winsorizada_val
+    }
+
+
 def limpiar_cache() -> None:
     """
     Limpia el cache de cálculos para liberar memoria.
+    
+    Se conserva por compatibilidad: la librería ya no guarda resultados en memoria
+    entre llamadas (ver AlmacenResumenes para reutilizar resúmenes).
     """
-    global _calculo_cache
-    _calculo_cache.clear()
 
 
-def obtener_estadisticas_completas(numeros: List[Union[int, float]]) -> dict:
+def obtener_estadisticas_completas(numeros: List[Union[int, float]],
+                                   almacen: Optional["AlmacenResumenes"] = None) -> dict:
     """
     Calcula todas las estadísticas de una lista en una sola pasada optimizada.
     
     Args:
         numeros: Lista de números
+        almacen: Almacén en disco opcional. Si se indica, el resultado se busca
+                 primero por la huella de los datos y se guarda tras calcularlo.
         
     Returns:
         dict: Diccionario con todas las estadísticas calculadas
     """
     _validar_entrada(numeros, "media")
     
+    if almacen is not None:
+        huella = huella_datos(numeros)
+        guardado = almacen.obtener(huella, 'completas')
+        if guardado is not None:
+            return guardado
+    
     n = len(numeros)
     
     suma = sum(numeros)
@@ -339,7 +1010,7 @@ def obtener_estadisticas_completas(numeros: List[Union[int, float]]) -> dict:
     
     moda_val = moda(numeros)
     
-    return {
+    resultado = {
         'media': media_val,
         'mediana': mediana_val,
         'moda': moda_val,
@@ -350,3 +1021,356 @@ def obtener_estadisticas_completas(numeros: List[Union[int, float]]) -> dict:
         'cantidad': n,
         'suma': suma
     }
+    
+    if almacen is not None:
+        almacen.guardar(huella, 'completas', resultado)
+    
+    return resultado
+
+
+def huella_datos(numeros: List[Union[int, float]]) -> str:
+    """
+    Calcula una huella estable de los datos para usarla como clave persistente.
+    
+    La huella distingue enteros de flotantes y el orden de los valores, de modo
+    que dos listas con la misma huella producen exactamente las mismas estadísticas.
+    Las listas de solo int de 64 bits o de solo float se codifican en binario;
+    el resto (listas mixtas, enteros más grandes, bool u otras subclases)
+    recurre a su representación textual, que conserva el tipo de cada valor.
+    
+    Args:
+        numeros: Lista de números
+        
+    Returns:
+        str: Huella hexadecimal de 32 caracteres
+    """
+    import hashlib
+    from array import array
+    
+    # Se comparan tipos exactos: array("q") aceptaría bool y lo confundiría con int
+    tipos = set(map(type, numeros))
+    datos = None
+    if tipos == {int}:
+        try:
+            datos = b"i" + array("q", numeros).tobytes()
+        except OverflowError:
+            pass
+    elif tipos == {float}:
+        datos = b"f" + array("d", numeros).tobytes()
+    if datos is None:
+        datos = b"r" + repr(list(numeros)).encode("ascii")
+    return hashlib.blake2b(datos, digest_size=16).hexdigest()
+
+
+def resumen_momentos(numeros: List[Union[int, float]], hilos: Optional[int] = None) -> dict:
+    """
+    Calcula un resumen de momentos combinable con otros resúmenes.
+    
+    Args:
+        numeros: Lista de números
+        hilos: Si se indica, las listas grandes se procesan por fragmentos en un
+               grupo de hilos de ese tamaño.
+        
+    Returns:
+        dict: Diccionario con 'n', 'media', 'm2' (suma de cuadrados de las
+              desviaciones), 'minimo' y 'maximo'
+        
+    Raises:
+        ErrorEstadisticas: Si la lista está vacía, contiene valores no numéricos
+                        o hilos no es un entero positivo
+    """
+    _validar_entrada(numeros, "media")
+    _validar_hilos(hilos)
+    
+    if hilos is not None and len(numeros) > _UMBRAL_PARALELO:
+        return _resumen_paralelo(numeros, hilos)
+    return _resumen_fragmento(numeros)
+
+
+def _resumen_fragmento(numeros: List[Union[int, float]]) -> dict:
+    """
+    Resumen de momentos de un fragmento ya validado.
+    
+    Usa dos pasadas (media y luego desviaciones) en lugar de Welford para no
+    dividir en cada elemento; ambas pasadas corren sobre primitivas en C.
+    """
+    n = len(numeros)
+    media_val = sum(numeros) / n
+    desviaciones = [x - media_val for x in numeros]
+    return {
+        'n': n,
+        'media': media_val,
+        'm2': sum(map(operator.mul, desviaciones, desviaciones)),
+        'minimo': min(numeros),
+        'maximo': max(numeros)
+    }
+
+
+def combinar_momentos(a: dict, b: dict) -> dict:
+    """
+    Combina dos resúmenes de momentos con la fórmula paralela de Chan.
+    
+    El resultado es equivalente al resumen de la concatenación de ambos conjuntos
+    de datos, por lo que los resúmenes de fragmentos pueden guardarse por separado
+    y unirse después sin recalcular.
+    
+    Args:
+        a: Resumen producido por resumen_momentos
+        b: Resumen producido por resumen_momentos
+        
+    Returns:
+        dict: Resumen combinado
+    """
+    n = a['n'] + b['n']
+    delta = b['media'] - a['media']
+    return {
+        'n': n,
+        'media': a['media'] + delta * b['n'] / n,
+        'm2': a['m2'] + b['m2'] + delta * delta * a['n'] * b['n'] / n,
+        'minimo': min(a['minimo'], b['minimo']),
+        'maximo': max(a['maximo'], b['maximo'])
+    }
+
+
+def _en_paralelo(numeros: List[Union[int, float]], hilos: int, kernel: Callable) -> list:
+    """
+    Aplica kernel a fragmentos contiguos de los datos en un grupo de hilos.
+    
+    Cada hilo trabaja sobre su propia copia del fragmento y solo produce un
+    resultado local, sin estado compartido. En CPython con GIL el resultado es
+    correcto pero no más rápido; en compilaciones sin GIL (free-threaded) los
+    fragmentos se procesan realmente en paralelo.
+    
+    El número de hilos se limita a los núcleos disponibles y a un fragmento de al
+    menos _TAMANO_MINIMO_FRAGMENTO valores por hilo, para que cada tarea haga
+    trabajo real; con un solo hilo efectivo el kernel se aplica directamente.
+    """
+    n = len(numeros)
+    hilos = min(hilos, os.cpu_count() or 1, max(1, n // _TAMANO_MINIMO_FRAGMENTO))
+    if hilos == 1:
+        return [kernel(numeros)]
+    
+    from concurrent.futures import ThreadPoolExecutor
+    
+    tamano_fragmento = -(-n // hilos)
+    fragmentos = [numeros[i:i + tamano_fragmento] for i in range(0, n, tamano_fragmento)]
+    
+    with ThreadPoolExecutor(max_workers=hilos) as grupo:
+        return list(grupo.map(kernel, fragmentos))
+
+
+def _media_paralela(numeros: List[Union[int, float]], hilos: int) -> float:
+    """Media a partir de la suma de cada fragmento, calculada en un grupo de hilos."""
+    return sum(_en_paralelo(numeros, hilos, sum)) / len(numeros)
+
+
+def _resumen_paralelo(numeros: List[Union[int, float]], hilos: int) -> dict:
+    """
+    Calcula el resumen de momentos repartiendo fragmentos en un grupo de hilos;
+    los resúmenes locales se combinan al final con combinar_momentos.
+    """
+    resumenes = _en_paralelo(numeros, hilos, _resumen_fragmento)
+    
+    resultado = resumenes[0]
+    for resumen in resumenes[1:]:
+        resultado = combinar_momentos(resultado, resumen)
+    return resultado
+
+
+# Versión de los resúmenes guardados; se incrementa cada vez que cambia el
+# resultado de alguna estadística para no servir valores obsoletos.
+_VERSION_RESUMENES = 2
+
+_ESQUEMA_ALMACEN = 1
+
+
+class AlmacenResumenes:
+    """
+    Almacén persistente en SQLite para resúmenes estadísticos precalculados.
+    
+    Cada entrada se identifica por la huella de los datos, el nombre de la
+    estadística y la versión del formato (_VERSION_RESUMENES), de modo que los
+    resúmenes escritos por versiones anteriores de la librería no se reutilizan.
+    Las escrituras son atómicas (una transacción por escritura) y el modo WAL
+    permite lectores concurrentes desde varios procesos. Cuando el tamaño total
+    de los valores guardados supera ``tamano_maximo`` bytes se descartan las
+    entradas más antiguas.
+    """
+    
+    def __init__(self, ruta: str, tamano_maximo: int = 64 * 1024 * 1024,
+                 timeout: float = 30.0):
+        """
+        Args:
+            ruta: Ruta del archivo SQLite (se crea si no existe)
+            tamano_maximo: Tamaño máximo en bytes de los valores guardados
+            timeout: Segundos de espera cuando otro proceso tiene el bloqueo
+        """
+        if tamano_maximo <= 0:
+            raise ErrorEstadisticas("El tamaño máximo del almacén debe ser positivo")
+        
+        self.ruta = os.fspath(ruta)
+        self.tamano_maximo = tamano_maximo
+        self.timeout = timeout
+        
+        con = self._conectar()
+        try:
+            con.execute("PRAGMA journal_mode=WAL")
+            con.execute("BEGIN IMMEDIATE")
+            try:
+                if con.execute("PRAGMA user_version").fetchone()[0] < _ESQUEMA_ALMACEN:
+                    # Tablas de antes de versionar los resúmenes: no son reutilizables
+                    con.execute("DROP TABLE IF EXISTS resumenes")
+                    con.execute("DROP TABLE IF EXISTS metadatos")
+                    con.execute(f"PRAGMA user_version = {_ESQUEMA_ALMACEN}")
+                con.execute(
+                    "CREATE TABLE IF NOT EXISTS resumenes ("
+                    " huella TEXT NOT NULL,"
+                    " estadistica TEXT NOT NULL,"
+                    " version INTEGER NOT NULL,"
+                    " valor TEXT NOT NULL,"
+                    " tamano INTEGER NOT NULL,"
+                    " creado REAL NOT NULL,"
+                    " PRIMARY KEY (huella, estadistica, version))"
+                )
+                con.execute(
+                    "CREATE INDEX IF NOT EXISTS resumenes_creado ON resumenes (creado)"
+                )
+                con.execute(
+                    "CREATE TABLE IF NOT EXISTS metadatos ("
+                    " clave TEXT PRIMARY KEY,"
+                    " valor INTEGER NOT NULL)"
+                )
+                con.execute(
+                    "INSERT OR IGNORE INTO metadatos (clave, valor) VALUES ('tamano_total', 0)"
+                )
+                con.execute("COMMIT")
+            except BaseException:
+                con.execute("ROLLBACK")
+                raise
+        finally:
+            con.close()
+    
+    def _conectar(self) -> "sqlite3.Connection":
+        """Abre una conexión nueva; las conexiones no se comparten entre llamadas."""
+        import sqlite3
+        
+        return sqlite3.connect(self.ruta, timeout=self.timeout, isolation_level=None)
+    
+    def obtener(self, huella: str, estadistica: str):
+        """
+        Obtiene un resumen guardado.
+        
+        Args:
+            huella: Huella de los datos (ver huella_datos)
+            estadistica: Nombre de la estadística
+            
+        Returns:
+            El valor guardado, o None si no existe
+        """
+        con = self._conectar()
+        try:
+            fila = con.execute(
+                "SELECT valor FROM resumenes"
+                " WHERE huella = ? AND estadistica = ? AND version = ?",
+                (huella, estadistica, _VERSION_RESUMENES)
+            ).fetchone()
+        finally:
+            con.close()
+        
+        if fila is None:
+            return None
+        
+        import json
+        return json.loads(fila[0])
+    
+    def guardar(self, huella: str, estadistica: str, valor) -> None:
+        """
+        Guarda un resumen de forma atómica, reemplazando el anterior si existía.
+        
+        Args:
+            huella: Huella de los datos (ver huella_datos)
+            estadistica: Nombre de la estadística
+            valor: Valor serializable a JSON (número, dict o lista)
+        """
+        import json
+        
+        texto = json.dumps(valor)
+        tamano = len(texto)
+        if tamano > self.tamano_maximo:
+            return
+        
+        clave = (huella, estadistica, _VERSION_RESUMENES)
+        con = self._conectar()
+        try:
+            con.execute("BEGIN IMMEDIATE")
+            try:
+                previa = con.execute(
+                    "SELECT tamano FROM resumenes"
+                    " WHERE huella = ? AND estadistica = ? AND version = ?", clave
+                ).fetchone()
+                con.execute(
+                    "INSERT OR REPLACE INTO resumenes"
+                    " (huella, estadistica, version, valor, tamano, creado)"
+                    " VALUES (?, ?, ?, ?, ?, ?)",
+                    clave + (texto, tamano, time.time())
+                )
+                total = self._sumar_tamano(con, tamano - (previa[0] if previa else 0))
+                if total > self.tamano_maximo:
+                    self._desalojar(con, total)
+                con.execute("COMMIT")
+            except BaseException:
+                con.execute("ROLLBACK")
+                raise
+        finally:
+            con.close()
+    
+    @staticmethod
+    def _sumar_tamano(con: "sqlite3.Connection", delta: int) -> int:
+        """Actualiza el tamaño total guardado en metadatos y retorna el nuevo valor."""
+        con.execute(
+            "UPDATE metadatos SET valor = valor + ? WHERE clave = 'tamano_total'", (delta,)
+        )
+        return con.execute(
+            "SELECT valor FROM metadatos WHERE clave = 'tamano_total'"
+        ).fetchone()[0]
+    
+    def _desalojar(self, con: "sqlite3.Connection", total: int) -> None:
+        """Elimina las entradas más antiguas hasta respetar el tamaño máximo."""
+        exceso = total - self.tamano_maximo
+        liberado = 0
+        filas = []
+        for fila in con.execute(
+            "SELECT rowid, tamano FROM resumenes ORDER BY creado"
+        ):
+            filas.append((fila[0],))
+            liberado += fila[1]
+            if liberado >= exceso:
+                break
+        
+        con.executemany("DELETE FROM resumenes WHERE rowid = ?", filas)
+        self._sumar_tamano(con, -liberado)
+    
+    def tamano(self) -> int:
+        """Retorna el tamaño total en bytes de los valores guardados."""
+        con = self._conectar()
+        try:
+            return con.execute(
+                "SELECT valor FROM metadatos WHERE clave = 'tamano_total'"
+            ).fetchone()[0]
+        finally:
+            con.close()
+    
+    def limpiar(self) -> None:
+        """Elimina todas las entradas del almacén."""
+        con = self._conectar()
+        try:
+            con.execute("BEGIN IMMEDIATE")
+            try:
+                con.execute("DELETE FROM resumenes")
+                con.execute("UPDATE metadatos SET valor = 0 WHERE clave = 'tamano_total'")
+                con.execute("COMMIT")
+            except BaseException:
+                con.execute("ROLLBACK")
+                raise
+        finally:
+            con.close()
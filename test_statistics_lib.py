@@ -8,9 +8,20 @@ Las pruebas cubren:
 """
 
 import unittest
+import importlib.util
 import math
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import statistics_lib
 from statistics_lib import (
-    media, mediana, moda, varianza, ds, ErrorEstadisticas
+    media, mediana, moda, varianza, ds, ErrorEstadisticas,
+    AlmacenResumenes, huella_datos, resumen_momentos, combinar_momentos,
+    obtener_estadisticas_completas, limpiar_cache,
+    mad, media_recortada, media_winsorizada, resumen_robusto,
+    registrar_backend, listar_backends, seleccionar_backend
 )
 
 
@@ -279,5 +290,480 @@ class TestIntegracion(unittest.TestCase):
         self.assertAlmostEqual(ds_muest, math.sqrt(var_muest), places=10)
 
 
+class TestRutaEnteros(unittest.TestCase):
+    """Casos de prueba para las rutas especializadas en enteros"""
+    
+    def setUp(self):
+        self.enteros = [(i * 37) % 101 for i in range(5001)]
+        self.flotantes = [float(x) for x in self.enteros]
+    
+    def test_enteros_coinciden_con_ruta_flotante(self):
+        """Prueba que las rutas enteras den los mismos resultados que las flotantes"""
+        self.assertAlmostEqual(media(self.enteros), media(self.flotantes), places=10)
+        self.assertEqual(mediana(self.enteros), mediana(self.flotantes))
+        self.assertEqual(moda(self.enteros), moda(self.flotantes))
+        self.assertAlmostEqual(varianza(self.enteros), varianza(self.flotantes), places=8)
+        self.assertAlmostEqual(ds(self.enteros, poblacion=False),
+                               ds(self.flotantes, poblacion=False), places=8)
+    
+    def test_varianza_enteros_exacta_con_valores_grandes(self):
+        """Prueba que la varianza entera no pierda precisión con valores enormes"""
+        base = 10 ** 20
+        numeros = [base + i for i in range(2000)]
+        esperado = (2000 ** 2 - 1) / 12
+        self.assertEqual(varianza(numeros), esperado)
+        self.assertEqual(media(numeros), base + 999.5)
+    
+    def test_mediana_par_grande(self):
+        """Prueba la mediana de listas grandes con número par de elementos"""
+        numeros = list(range(100, 0, -1))
+        self.assertEqual(mediana(numeros), 50.5)
+        self.assertEqual(mediana(numeros + [10 ** 6, -10 ** 6]), 50.5)
+        self.assertEqual(mediana([float(x) for x in numeros]), 50.5)
+    
+    def test_moda_enteros_empate_retorna_menor(self):
+        """Prueba que la moda de enteros grandes con empate retorne el menor valor"""
+        numeros = [5] * 60 + [3] * 60 + [9] * 10
+        self.assertEqual(moda(numeros), 3)
+
+
+class TestEstadisticasRobustas(unittest.TestCase):
+    """Casos de prueba para mad, media_recortada, media_winsorizada y resumen_robusto"""
+    
+    def test_mad_camino_feliz(self):
+        """Prueba MAD con un valor atípico"""
+        numeros = [1, 1, 2, 2, 4, 6, 9]
+        self.assertEqual(mad(numeros), 1)
+        self.assertAlmostEqual(mad(numeros, normalizada=True), 1.4826, places=4)
+    
+    def test_media_recortada_camino_feliz(self):
+        """Prueba media recortada descartando un valor por extremo"""
+        numeros = [100, 1, 2, 3, 4, 5, 6, 7, 8, -100]
+        self.assertEqual(media_recortada(numeros, 0.1), 4.5)
+        self.assertEqual(media_recortada(numeros, 0), media(numeros))
+    
+    def test_media_winsorizada_camino_feliz(self):
+        """Prueba media winsorizada sustituyendo un valor por extremo"""
+        numeros = [100, 1, 2, 3, 4, 5, 6, 7, 8, -100]
+        # [1, 1, 2, 3, 4, 5, 6, 7, 8, 8]
+        self.assertEqual(media_winsorizada(numeros, 0.1), 4.5)
+    
+    def test_listas_grandes_con_repetidos_coinciden_con_ordenacion(self):
+        """Prueba el motor de selección contra una referencia basada en ordenar"""
+        numeros = [((i * 7919) % 503) / 7 for i in range(2000)] + [1e9, -1e9]
+        ordenados = sorted(numeros)
+        n = len(numeros)
+        g = int(0.2 * n)
+        mediana_ref = (ordenados[n // 2 - 1] + ordenados[n // 2]) / 2
+        desviaciones = sorted(abs(x - mediana_ref) for x in numeros)
+        
+        self.assertEqual(mediana(numeros), mediana_ref)
+        self.assertEqual(mad(numeros), (desviaciones[n // 2 - 1] + desviaciones[n // 2]) / 2)
+        self.assertAlmostEqual(media_recortada(numeros, 0.2),
+                               sum(ordenados[g:n - g]) / (n - 2 * g), places=9)
+        self.assertAlmostEqual(
+            media_winsorizada(numeros, 0.2),
+            (sum(ordenados[g:n - g]) + g * (ordenados[g] + ordenados[n - g - 1])) / n,
+            places=9)
+    
+    def test_mad_coincide_con_referencia_en_varios_tamanos(self):
+        """Prueba la MAD obtenida de las dos mitades contra la definición directa"""
+        for n in (1, 2, 3, 4, 7, 60, 101):
+            numeros = [((i * 7919) % 97) / 3 - (i % 5) for i in range(n)]
+            ordenados = sorted(numeros)
+            centro = (ordenados[(n - 1) // 2] + ordenados[n // 2]) / 2
+            desviaciones = sorted(abs(x - centro) for x in numeros)
+            esperado = (desviaciones[(n - 1) // 2] + desviaciones[n // 2]) / 2
+            self.assertEqual(mad(numeros), esperado)
+            self.assertEqual(resumen_robusto(numeros)['mad'], esperado)
+    
+    def test_datos_en_forma_de_v(self):
+        """Prueba que los datos en forma de V no degraden la selección a tiempo cuadrático"""
+        n = 50000
+        numeros = [abs(i - n / 2) for i in range(n)]
+        ordenados = sorted(numeros)
+        self.assertEqual(mediana(numeros), (ordenados[n // 2 - 1] + ordenados[n // 2]) / 2)
+        self.assertEqual(media_recortada(numeros, 0.25),
+                         sum(ordenados[12500:37500]) / 25000)
+    
+    def test_resumen_robusto_coincide_con_funciones_individuales(self):
+        """Prueba que el resumen compartido coincida con las llamadas separadas"""
+        numeros = [((i * 37) % 101) - 50.5 for i in range(999)]
+        resumen = resumen_robusto(numeros, 0.05)
+        self.assertEqual(resumen['mediana'], mediana(numeros))
+        self.assertEqual(resumen['mad'], mad(numeros))
+        self.assertAlmostEqual(resumen['media_recortada'], media_recortada(numeros, 0.05), places=10)
+        self.assertAlmostEqual(resumen['media_winsorizada'], media_winsorizada(numeros, 0.05), places=10)
+    
+    def test_no_modifica_la_entrada(self):
+        """Prueba que las funciones robustas no alteren la lista original"""
+        numeros = list(range(200, 0, -1))
+        copia = list(numeros)
+        resumen_robusto(numeros)
+        self.assertEqual(numeros, copia)
+    
+    def test_error_lista_vacia(self):
+        """Prueba que lista vacía lance ErrorEstadisticas"""
+        with self.assertRaises(ErrorEstadisticas) as contexto:
+            mad([])
+        self.assertEqual(str(contexto.exception), "No se puede calcular la MAD de una lista vacía")
+    
+    def test_error_proporcion_invalida(self):
+        """Prueba que una proporción fuera de [0, 0.5) lance ErrorEstadisticas"""
+        with self.assertRaises(ErrorEstadisticas) as contexto:
+            media_recortada([1, 2, 3], 0.5)
+        self.assertEqual(str(contexto.exception), "La proporción de recorte debe estar entre 0 y 0.5")
+        with self.assertRaises(ErrorEstadisticas):
+            media_winsorizada([1, 2, 3], -0.1)
+
+
+class TestAlmacenResumenes(unittest.TestCase):
+    """Casos de prueba para el almacén persistente de resúmenes"""
+    
+    def setUp(self):
+        self.directorio = tempfile.TemporaryDirectory()
+        self.ruta = os.path.join(self.directorio.name, "resumenes.sqlite")
+    
+    def tearDown(self):
+        self.directorio.cleanup()
+    
+    def test_huella_distingue_tipos_y_orden(self):
+        """Prueba que la huella cambie con el tipo y el orden de los valores"""
+        self.assertEqual(huella_datos([1, 2, 3]), huella_datos([1, 2, 3]))
+        self.assertNotEqual(huella_datos([1, 2, 3]), huella_datos([1.0, 2, 3]))
+        self.assertNotEqual(huella_datos([1, 2, 3]), huella_datos([3, 2, 1]))
+        self.assertNotEqual(huella_datos([1.0, 2.0]), huella_datos([1.0, 2.5]))
+        self.assertNotEqual(huella_datos([2 ** 70, 1]), huella_datos([2 ** 70 + 1, 1]))
+        self.assertNotEqual(huella_datos([True, False, True]), huella_datos([1, 0, 1]))
+        self.assertNotEqual(huella_datos([True, 2]), huella_datos([1, 2]))
+    
+    def test_combinar_momentos_equivale_a_concatenar(self):
+        """Prueba que combinar resúmenes de fragmentos equivale al resumen total"""
+        a = [1, 2, 3, 4]
+        b = [10.5, -3, 7]
+        combinado = combinar_momentos(resumen_momentos(a), resumen_momentos(b))
+        total = resumen_momentos(a + b)
+        self.assertEqual(combinado['n'], 7)
+        self.assertAlmostEqual(combinado['media'], total['media'], places=10)
+        self.assertAlmostEqual(combinado['m2'] / combinado['n'], varianza(a + b), places=10)
+        self.assertEqual(combinado['minimo'], -3)
+        self.assertEqual(combinado['maximo'], 10.5)
+    
+    def test_guardar_y_obtener_entre_instancias(self):
+        """Prueba que los resúmenes persistan al abrir el almacén de nuevo"""
+        AlmacenResumenes(self.ruta).guardar("abc", "momentos", {'n': 3, 'media': 2.0})
+        self.assertEqual(AlmacenResumenes(self.ruta).obtener("abc", "momentos"),
+                         {'n': 3, 'media': 2.0})
+        self.assertIsNone(AlmacenResumenes(self.ruta).obtener("abc", "otra"))
+    
+    def test_estadisticas_completas_usan_almacen(self):
+        """Prueba que las estadísticas completas se guarden y se reutilicen"""
+        almacen = AlmacenResumenes(self.ruta)
+        numeros = [1, 2, 2, 3, 4]
+        calculado = obtener_estadisticas_completas(numeros, almacen=almacen)
+        guardado = almacen.obtener(huella_datos(numeros), 'completas')
+        self.assertEqual(guardado, calculado)
+        self.assertEqual(obtener_estadisticas_completas(numeros, almacen=almacen), calculado)
+    
+    def test_desalojo_por_tamano(self):
+        """Prueba que se descarten las entradas más antiguas al superar el tamaño"""
+        almacen = AlmacenResumenes(self.ruta, tamano_maximo=100)
+        for i in range(10):
+            almacen.guardar(f"h{i}", "lista", list(range(10)))
+        self.assertLessEqual(almacen.tamano(), 100)
+        self.assertIsNone(almacen.obtener("h0", "lista"))
+        self.assertEqual(almacen.obtener("h9", "lista"), list(range(10)))
+    
+    def test_tamano_total_con_reemplazos(self):
+        """Prueba que el tamaño total se mantenga al reemplazar y limpiar entradas"""
+        almacen = AlmacenResumenes(self.ruta)
+        almacen.guardar("h", "lista", [1, 2, 3])
+        almacen.guardar("h", "lista", [1])
+        self.assertEqual(almacen.tamano(), len("[1]"))
+        almacen.limpiar()
+        self.assertEqual(almacen.tamano(), 0)
+    
+    def test_no_reutiliza_resumenes_de_otra_version(self):
+        """Prueba que los resúmenes de otra versión del formato no se sirvan"""
+        almacen = AlmacenResumenes(self.ruta)
+        almacen.guardar("h", "completas", {'mediana': 1})
+        version = statistics_lib._VERSION_RESUMENES
+        try:
+            statistics_lib._VERSION_RESUMENES = version + 1
+            self.assertIsNone(almacen.obtener("h", "completas"))
+        finally:
+            statistics_lib._VERSION_RESUMENES = version
+        self.assertEqual(almacen.obtener("h", "completas"), {'mediana': 1})
+    
+    def test_descarta_tabla_sin_version(self):
+        """Prueba que un archivo con el esquema sin versión se descarte al abrirlo"""
+        import sqlite3
+        con = sqlite3.connect(self.ruta)
+        con.execute("CREATE TABLE resumenes (huella TEXT, estadistica TEXT, valor TEXT,"
+                    " tamano INTEGER, creado REAL, PRIMARY KEY (huella, estadistica))")
+        con.execute("INSERT INTO resumenes VALUES ('h', 'completas', '{}', 2, 0)")
+        con.commit()
+        con.close()
+        
+        almacen = AlmacenResumenes(self.ruta)
+        self.assertIsNone(almacen.obtener("h", "completas"))
+        self.assertEqual(almacen.tamano(), 0)
+    
+    def test_error_tamano_maximo_invalido(self):
+        """Prueba que un tamaño máximo no positivo lance ErrorEstadisticas"""
+        with self.assertRaises(ErrorEstadisticas):
+            AlmacenResumenes(self.ruta, tamano_maximo=0)
+
+
+class TestConcurrencia(unittest.TestCase):
+    """Pruebas de uso concurrente desde varios hilos"""
+    
+    def test_modo_hilos_equivale_a_secuencial(self):
+        """Prueba que el modo por hilos produzca los mismos resultados"""
+        numeros = [((i * 7919) % 1000) / 10 for i in range(50000)]
+        self.assertAlmostEqual(media(numeros, hilos=4), media(numeros), places=9)
+        self.assertAlmostEqual(varianza(numeros, hilos=4), varianza(numeros), places=6)
+        self.assertAlmostEqual(ds(numeros, poblacion=False, hilos=3),
+                               ds(numeros, poblacion=False), places=9)
+        self.assertEqual(resumen_momentos(numeros, hilos=4)['n'], 50000)
+    
+    def test_modo_hilos_con_enteros_es_exacto(self):
+        """Prueba que el modo por hilos con enteros conserve la ruta exacta"""
+        base = 10 ** 20
+        numeros = [base + i for i in range(30000)]
+        self.assertEqual(media(numeros, hilos=4), media(numeros))
+        self.assertEqual(varianza(numeros, hilos=4), (30000 ** 2 - 1) / 12)
+        self.assertEqual(ds(numeros, poblacion=False, hilos=3), ds(numeros, poblacion=False))
+    
+    def test_hilos_excesivos_se_limitan(self):
+        """Prueba que un número de hilos enorme no cree una tarea por elemento"""
+        numeros = [float(i) for i in range(20001)]
+        self.assertEqual(media(numeros, hilos=20001), media(numeros))
+        self.assertEqual(varianza(list(range(20001)), hilos=5000), varianza(list(range(20001))))
+        
+        fragmentos = statistics_lib._en_paralelo(numeros, 20001, len)
+        self.assertLessEqual(len(fragmentos), 20001 // statistics_lib._TAMANO_MINIMO_FRAGMENTO)
+        self.assertLessEqual(len(fragmentos), os.cpu_count() or 1)
+        self.assertEqual(sum(fragmentos), 20001)
+    
+    def test_error_hilos_invalidos(self):
+        """Prueba que un número de hilos inválido lance ErrorEstadisticas"""
+        with self.assertRaises(ErrorEstadisticas):
+            media(list(range(20000)), hilos=-1)
+        with self.assertRaises(ErrorEstadisticas) as contexto:
+            varianza([1.5, 2.5], hilos=0)
+        self.assertEqual(str(contexto.exception), "El número de hilos debe ser positivo")
+        with self.assertRaises(ErrorEstadisticas):
+            ds([1.5, 2.5], hilos=2.0)
+        with self.assertRaises(ErrorEstadisticas):
+            resumen_momentos([1.5, 2.5], hilos=-3)
+    
+    def test_estres_hilos_concurrentes(self):
+        """Prueba de estrés: muchos hilos usando el almacén y el registro de backends a la vez"""
+        cargas = []
+        
+        def cargador():
+            cargas.append(1)
+            return {'media': lambda numeros: sum(numeros) / len(numeros),
+                    'varianza': lambda numeros, poblacion: None}
+        
+        registrar_backend('estres', cargador, umbral=150)
+        self.addCleanup(statistics_lib._backends.pop, 'estres', None)
+        self.addCleanup(seleccionar_backend, None)
+        
+        directorio = tempfile.TemporaryDirectory()
+        self.addCleanup(directorio.cleanup)
+        almacen = AlmacenResumenes(os.path.join(directorio.name, "estres.sqlite"))
+        
+        conjuntos = [list(range(k, k + 200)) for k in range(8)]
+        esperados = [(media(c), varianza(c), ds(c), mediana(c), obtener_estadisticas_completas(c))
+                     for c in conjuntos]
+        errores = []
+        barrera = threading.Barrier(9)
+        
+        def trabajador(indice):
+            barrera.wait()
+            try:
+                for _ in range(50):
+                    c = conjuntos[indice]
+                    resultado = (media(c), varianza(c), ds(c), mediana(c),
+                                 obtener_estadisticas_completas(c, almacen=almacen))
+                    if resultado != esperados[indice]:
+                        errores.append(resultado)
+                    limpiar_cache()
+            except Exception as e:
+                errores.append(e)
+        
+        def alternador():
+            barrera.wait()
+            try:
+                for i in range(200):
+                    seleccionar_backend('python' if i % 2 else 'estres', forzar=i % 3 == 0)
+            except Exception as e:
+                errores.append(e)
+        
+        hilos = [threading.Thread(target=trabajador, args=(i,)) for i in range(8)]
+        hilos.append(threading.Thread(target=alternador))
+        for h in hilos:
+            h.start()
+        for h in hilos:
+            h.join()
+        self.assertEqual(errores, [])
+        self.assertLessEqual(len(cargas), 1)
+
+
+class TestBackends(unittest.TestCase):
+    """Casos de prueba para el registro de backends acelerados"""
+    
+    def setUp(self):
+        self.cargas = 0
+        
+        def cargador():
+            self.cargas += 1
+            return {'media': lambda numeros: -1.0,
+                    'varianza': lambda numeros, poblacion: None}
+        
+        registrar_backend('prueba', cargador, umbral=1000)
+    
+    def tearDown(self):
+        statistics_lib._backends.pop('prueba', None)
+        statistics_lib._backends.pop('inexistente', None)
+        seleccionar_backend(None)
+    
+    def test_carga_diferida_solo_con_listas_grandes(self):
+        """Prueba que el backend se cargue solo al recibir una lista grande"""
+        self.assertEqual(media([1.0, 2.0, 3.0]), 2.0)
+        self.assertEqual(self.cargas, 0)
+        self.assertEqual(media([float(i) for i in range(1000)]), -1.0)
+        self.assertEqual(media([float(i) for i in range(2000)]), -1.0)
+        self.assertEqual(self.cargas, 1)
+    
+    def test_enteros_usan_ruta_exacta_en_modo_automatico(self):
+        """Prueba que en modo automático las listas de enteros no pasen por el backend"""
+        numeros = [10 ** 17 + i % 2 for i in range(2000)]
+        self.assertEqual(media(numeros), 10 ** 17 + 0.5)
+        self.assertEqual(varianza(numeros), 0.25)
+        self.assertEqual(self.cargas, 0)
+        
+        seleccionar_backend('prueba')
+        self.assertEqual(media(numeros), -1.0)
+    
+    def test_kernel_sin_soporte_usa_python(self):
+        """Prueba que un kernel que retorna None o falta recurra a Python puro"""
+        numeros = [float(i) for i in range(1500)]
+        self.assertAlmostEqual(varianza(numeros), (1500 ** 2 - 1) / 12, places=6)
+        self.assertEqual(mediana(numeros), 749.5)
+        self.assertEqual(self.cargas, 1)
+    
+    def test_seleccionar_python_y_forzar(self):
+        """Prueba seleccionar Python puro y forzar un backend con listas pequeñas"""
+        seleccionar_backend('python')
+        self.assertEqual(media([float(i) for i in range(1000)]), 499.5)
+        seleccionar_backend('prueba', forzar=True)
+        self.assertEqual(media([1, 2, 3]), -1.0)
+    
+    def test_listar_backends(self):
+        """Prueba que la lista de backends refleje el estado sin cargar nada"""
+        seleccionar_backend('prueba')
+        backends = {b['nombre']: b for b in listar_backends()}
+        self.assertIn('python', backends)
+        self.assertIn('numpy', backends)
+        self.assertTrue(backends['prueba']['seleccionado'])
+        self.assertFalse(backends['prueba']['cargado'])
+        self.assertEqual(self.cargas, 0)
+    
+    def test_cargador_que_usa_el_registro_no_bloquea(self):
+        """Prueba que un cargador que llama al registro no provoque un bloqueo mutuo"""
+        numeros = [float(i) for i in range(2000)]
+        vistos = []
+        
+        def cargador():
+            vistos.append([b['nombre'] for b in listar_backends()])
+            registrar_backend('inexistente', lambda: {})
+            # Pedir el propio backend durante la carga usa Python puro
+            vistos.append(media(numeros))
+            return {'media': lambda datos: -2.0}
+        
+        registrar_backend('reentrante', cargador, umbral=10)
+        self.addCleanup(statistics_lib._backends.pop, 'reentrante', None)
+        seleccionar_backend('reentrante')
+        
+        resultados = []
+        hilo = threading.Thread(target=lambda: resultados.append(media(numeros)), daemon=True)
+        hilo.start()
+        hilo.join(timeout=10)
+        
+        self.assertFalse(hilo.is_alive(), "El cargador quedó bloqueado")
+        self.assertEqual(resultados, [-2.0])
+        self.assertIn('reentrante', vistos[0])
+        self.assertEqual(vistos[1], 999.5)
+    
+    def test_error_backend_desconocido_o_no_disponible(self):
+        """Prueba que seleccionar un backend inválido lance ErrorEstadisticas"""
+        with self.assertRaises(ErrorEstadisticas) as contexto:
+            seleccionar_backend('desconocido')
+        self.assertEqual(str(contexto.exception), "Backend desconocido: desconocido")
+        
+        def cargador():
+            raise ImportError("sin módulo")
+        
+        registrar_backend('inexistente', cargador)
+        with self.assertRaises(ErrorEstadisticas):
+            seleccionar_backend('inexistente', forzar=True)
+        # Tras un fallo de carga, la selección sin forzar informa la causa real
+        with self.assertRaises(ErrorEstadisticas) as contexto:
+            seleccionar_backend('inexistente')
+        self.assertEqual(str(contexto.exception),
+                         "No se pudo cargar el backend inexistente: sin módulo")
+        
+        registrar_backend('sin_modulo', lambda: {}, requiere='modulo_que_no_existe_xyz')
+        self.addCleanup(statistics_lib._backends.pop, 'sin_modulo', None)
+        with self.assertRaises(ErrorEstadisticas) as contexto:
+            seleccionar_backend('sin_modulo')
+        self.assertEqual(str(contexto.exception), "No se pudo cargar el backend sin_modulo: "
+                                                  "falta el módulo modulo_que_no_existe_xyz")
+    
+    @unittest.skipUnless(importlib.util.find_spec('numpy'), "NumPy no está instalado")
+    def test_backend_numpy_coincide_con_python(self):
+        """Prueba que el backend NumPy forzado coincida con Python puro"""
+        numeros = [((i * 37) % 101) / 3 for i in range(5000)]
+        esperados = [media(numeros), mediana(numeros), moda(numeros),
+                     varianza(numeros, poblacion=False), ds(numeros)]
+        seleccionar_backend('numpy', forzar=True)
+        obtenidos = [media(numeros), mediana(numeros), moda(numeros),
+                     varianza(numeros, poblacion=False), ds(numeros)]
+        for esperado, obtenido in zip(esperados, obtenidos):
+            self.assertAlmostEqual(esperado, obtenido, places=8)
+        
+        enteros = [10 ** 17 + i % 2 for i in range(200000)]
+        self.assertEqual(varianza(enteros), 0.25)
+
+
+class TestTiempoImportacion(unittest.TestCase):
+    """Prueba de rendimiento que protege el tiempo de arranque de la librería"""
+    
+    PRESUPUESTO_SEGUNDOS = 0.25
+    
+    def test_importacion_rapida_y_sin_modulos_pesados(self):
+        """Prueba que importar la librería sea rápido y no cargue módulos pesados"""
+        codigo = (
+            "import sys, time\n"
+            "inicio = time.perf_counter()\n"
+            "import statistics_lib\n"
+            "print(time.perf_counter() - inicio)\n"
+            "pesados = ['numpy', 'sqlite3', 'json', 'hashlib', 'concurrent.futures']\n"
+            "print(','.join(m for m in pesados if m in sys.modules))\n"
+        )
+        directorio = os.path.dirname(os.path.abspath(statistics_lib.__file__))
+        # Una primera ejecución compila el bytecode para no medirlo
+        subprocess.run([sys.executable, "-c", "import statistics_lib"],
+                       cwd=directorio, check=True)
+        salida = subprocess.run([sys.executable, "-c", codigo], cwd=directorio,
+                                check=True, capture_output=True, text=True).stdout.split("\n")
+        
+        self.assertEqual(salida[1], "")
+        self.assertLess(float(salida[0]), self.PRESUPUESTO_SEGUNDOS)
+
+
 if __name__ == '__main__':
     unittest.main()